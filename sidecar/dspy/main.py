@@ -7,6 +7,11 @@ Environment variables
 ROUTER_BASE_URL   Base URL of the Open AI Router (default http://localhost:3000)
 DSPY_SIDECAR_PORT Port to listen on (default 8780)
 DSPY_DEFAULT_LM   Fallback LM model name for the router (default gpt-4o-mini)
+DSPY_SIDECAR_WORKERS
+                  Max threads for blocking DSPy calls on DSPy builds
+                  without ``acall`` (default 32)
+DSPY_SIDECAR_WORKERS_PROC
+                  Number of uvicorn worker processes (default 1)
 
 The sidecar configures ``dspy.LM`` with ``api_base`` pointing back to the
 router so every LM call the DSPy module makes is routed through the same
@@ -18,6 +23,7 @@ When ``stream=True`` the sidecar uses ``dspy.streamify`` to stream progress
 back as SSE events.  Each event is a JSON object with a ``type`` field:
 
   * ``chunk``      — incremental token for a signature field
+  * ``chunks``     — several consecutive tokens for one field (``texts``)
   * ``status``     — status/progress message from DSPy internals
   * ``tool_call``  — tool invocation from ReAct
   * ``prediction`` — final prediction (all output fields)
@@ -26,33 +32,111 @@ back as SSE events.  Each event is a JSON object with a ``type`` field:
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
 import json
 import logging
 import os
-import traceback
+import re
+from collections.abc import AsyncGenerator, AsyncIterator
 from typing import Any
 
 import dspy
+import httpx
+import litellm
 import uvicorn
+from dspy import Prediction
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse, StreamingResponse
 
+try:
+    from dspy.streaming import StatusMessage, StreamListener, StreamResponse
+except ImportError:  # Older DSPy builds without field-level streaming.
+    StatusMessage = StreamListener = StreamResponse = None
+
+try:
+    from litellm import ModelResponseStream
+except ImportError:
+    ModelResponseStream = None
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json is a drop-in fallback.
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
 # ─── Configuration ────────────────────────────────────────────────────────────
 
 ROUTER_BASE_URL = os.getenv("ROUTER_BASE_URL", "http://localhost:3000/inference/v1")
 SIDECAR_PORT = int(os.getenv("DSPY_SIDECAR_PORT", "8780"))
 DEFAULT_LM = os.getenv("DSPY_DEFAULT_LM", "gpt-4o-mini")
+SIDECAR_WORKERS = int(os.getenv("DSPY_SIDECAR_WORKERS", "32"))
+SIDECAR_PROCS = int(os.getenv("DSPY_SIDECAR_WORKERS_PROC", "1"))
 
 logger = logging.getLogger("dspy_sidecar")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 
-app = FastAPI(title="DSPy Bridge Sidecar", version="0.1.0")
+# Bounded pool for synchronous DSPy calls (only used when the installed DSPy
+# has no native async entry point).  The default asyncio executor
+# would grow one thread per concurrent request, each holding LM state.
+_EXEC = concurrent.futures.ThreadPoolExecutor(
+    max_workers=SIDECAR_WORKERS,
+    thread_name_prefix="dspy",
+)
+
+
+# One connection pool for every LM call back into the router.  litellm's
+# OpenAI-compatible provider picks this up for all async requests, so
+# cached LMs share keep-alive connections instead of opening their own.
+_HTTP = httpx.AsyncClient(
+    timeout=httpx.Timeout(300.0, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=256),
+)
+litellm.aclient_session = _HTTP
+
+
+@contextlib.asynccontextmanager
+async def _lifespan(app: FastAPI):
+    _warm_up()
+    yield
+    _EXEC.shutdown(wait=True)
+    await _HTTP.aclose()
+
+
+def _warm_up() -> None:
+    """Pre-build the default LM and modules so the first request is warm.
+
+    The LM is cached under the same ``(model, None)`` key ``invoke()`` uses,
+    so only requests without an auth token reuse it; the Go plugin usually
+    forwards ``X-Upstream-Authorization``, which keys a separate entry.
+    """
+    build_lm(DEFAULT_LM, None)
+    # The sidecar's own default signature and the Go plugin's default.
+    for signature in ("question -> answer", "history, question -> answer"):
+        _build_module_cached("cot", signature, ())
+        _build_module_cached("predict", signature, ())
+    logger.info("Warm-up complete (default LM %s)", DEFAULT_LM)
+
+
+app = FastAPI(title="DSPy Bridge Sidecar", version="0.1.0", lifespan=_lifespan)
 
 
 # ─── LM factory ──────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=256)
 def build_lm(model: str, auth_token: str | None = None) -> dspy.LM:
-    """Create a dspy.LM that calls back into the router."""
+    """Create a dspy.LM that calls back into the router.
+
+    Instances are cached per ``(model, auth_token)`` so steady-state traffic
+    reuses a warm litellm client instead of rebuilding one per request.
+    """
     api_base = ROUTER_BASE_URL
     api_key = auth_token or "sidecar-internal"
     return dspy.LM(
@@ -68,14 +152,43 @@ def build_lm(model: str, auth_token: str | None = None) -> dspy.LM:
 # ─── Module factory ──────────────────────────────────────────────────────────
 
 def build_module(kind: str, signature: str, tools: list[dict] | None = None) -> dspy.Module:
+    """Return the DSPy module for *kind*, reusing a cached instance.
+
+    Modules only hold their signature (and tool stubs for ReAct); the LM is
+    read from ``dspy.context`` at call time, so one instance can safely
+    serve every request with the same ``(kind, signature, tools)``.
+    """
+    tools_key: tuple[tuple[str, str, str], ...] = ()
+    # Only ReAct uses tools; other kinds ignore them (as before caching).
+    if kind == "react":
+        tools_key = tuple(
+            (
+                t.get("name", "unknown"),
+                t.get("description", ""),
+                json.dumps(t.get("schema", {}), sort_keys=True),
+            )
+            for t in tools or []
+        )
+    return _build_module_cached(kind, signature, tools_key)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_module_cached(
+    kind: str,
+    signature: str,
+    tools_key: tuple[tuple[str, str, str], ...],
+) -> dspy.Module:
     """Instantiate the appropriate DSPy module for *kind*."""
     if kind == "predict":
         return dspy.Predict(signature)
     elif kind == "cot":
         return dspy.ChainOfThought(signature)
     elif kind == "react":
-        dspy_tools = _convert_tools(tools or [])
-        return dspy.ReAct(signature, tools=dspy_tools)
+        tools = [
+            {"name": name, "description": desc, "schema": json.loads(schema)}
+            for name, desc, schema in tools_key
+        ]
+        return dspy.ReAct(signature, tools=_convert_tools(tools))
     elif kind == "rlm":
         # RLM is only available in newer DSPy builds; fall back to CoT.
         if hasattr(dspy, "RLM"):
@@ -86,106 +199,127 @@ def build_module(kind: str, signature: str, tools: list[dict] | None = None) ->
         raise ValueError(f"Unknown DSPy kind: {kind!r}")
 
 
-def _convert_tools(tools: list[dict]) -> list:
-    """Convert sidecar tool definitions to DSPy-compatible tool objects.
+def _convert_tools(tools: list[dict]) -> list[dspy.Tool]:
+    """Convert sidecar tool definitions to ``dspy.Tool`` objects.
 
-    DSPy ReAct expects tool callables (or dspy.Tool wrappers).  For now we
-    create thin stubs that simply return a JSON placeholder — the actual
-    tool execution is handled by the Go router's ToolPlugin.
+    The tool's JSON schema is passed straight through as ``args`` so ReAct
+    sees the real argument names.  The wrapped functions are thin stubs that
+    simply return a JSON placeholder — the actual tool execution is handled
+    by the Go router's ToolPlugin.
     """
     dspy_tools = []
     for td in tools:
         name = td.get("name", "unknown")
-        desc = td.get("description", "")
-        schema = td.get("schema", {})
-
-        # Create a stub function that DSPy can inspect.
-        def _make_stub(n: str, d: str, s: dict):
-            def stub(**kwargs: Any) -> str:
-                return json.dumps({
-                    "__tool_call__": True,
-                    "name": n,
-                    "args": kwargs,
-                })
-            stub.__name__ = n
-            stub.__doc__ = d
-            # Attach schema for DSPy introspection.
-            stub.__json_schema__ = s
-            return stub
-
-        dspy_tools.append(_make_stub(name, desc, schema))
+        schema = td.get("schema") or {}
+        dspy_tools.append(dspy.Tool(
+            _make_tool_stub(name),
+            name=name,
+            desc=td.get("description", ""),
+            args=schema.get("properties", {}),
+        ))
     return dspy_tools
 
 
+def _make_tool_stub(name: str):
+    """Return a placeholder callable for tool *name*."""
+    # Everything but the call arguments is constant, so encode it once.
+    prefix = b'{"__tool_call__":true,"name":' + _json_dumps(name) + b',"args":'
+
+    def stub(**kwargs: Any) -> str:
+        return (prefix + _json_dumps(kwargs) + b"}").decode()
+
+    stub.__name__ = name
+    return stub
+
+
 # ─── History → DSPy messages ─────────────────────────────────────────────────
 
-def build_history_value(raw_history: str | list) -> list[dict[str, str]]:
+def build_history_value(raw_history: str | bytes | list) -> list[dict[str, str]]:
     """Parse the ``history`` input into the format DSPy expects.
 
     The Go plugin serialises history as a JSON array of ``{role, content}``
     dicts.  If it arrives as a string (JSON-encoded), decode it first.
     """
-    if isinstance(raw_history, str):
+    if isinstance(raw_history, (str, bytes)):
         try:
-            raw_history = json.loads(raw_history)
+            raw_history = _json_loads(raw_history)
         except (json.JSONDecodeError, TypeError):
             return []
-    if not isinstance(raw_history, list):
+    if type(raw_history) is not list:
         return []
-    return [
-        {"role": m.get("role", "user"), "content": m.get("content", "")}
-        for m in raw_history
-        if isinstance(m, dict) and m.get("content")
-    ]
+    # Tight loop with a bound append: histories can run to many turns.
+    out: list[dict[str, str]] = []
+    append = out.append
+    for m in raw_history:
+        if type(m) is dict:
+            content = m.get("content")
+            if content:
+                append({"role": m.get("role", "user"), "content": content})
+    return out
 
 
 # ─── Non-streaming invocation ────────────────────────────────────────────────
 
-def invoke_sync(module: dspy.Module, inputs: dict[str, Any]) -> dict[str, Any]:
-    """Run the DSPy module synchronously and return the prediction."""
-    prediction = module(**inputs)
+async def invoke_async(module: dspy.Module, inputs: dict[str, Any]) -> dict[str, Any]:
+    """Run the DSPy module and return the prediction.
 
-    # Extract all output fields.
+    Uses DSPy's native ``acall`` so the call stays on the event loop.  The
+    base ``dspy.Module.acall`` only delegates to ``aforward``, so modules
+    whose class lacks it (older DSPy builds) fall back to the bounded worker
+    pool, carrying the caller's ``dspy.context`` into the thread.
+    """
+    if getattr(type(module), "aforward", None) is not None:
+        prediction = await module.acall(**inputs)
+    else:
+        ctx = contextvars.copy_context()
+        prediction = await asyncio.get_running_loop().run_in_executor(
+            _EXEC, functools.partial(ctx.run, module, **inputs),
+        )
+    return {"outputs": _prediction_outputs(prediction)}
+
+
+def _prediction_outputs(prediction: Any) -> dict[str, str]:
+    """Extract all output fields of *prediction* as strings."""
     outputs: dict[str, str] = {}
-    if hasattr(prediction, "items"):
+    if isinstance(prediction, Prediction):
         for k, v in prediction.items():
-            outputs[k] = str(v) if v is not None else ""
-    elif hasattr(prediction, "toDict"):
-        outputs = {k: str(v) for k, v in prediction.toDict().items()}
+            outputs[k] = "" if v is None else v if isinstance(v, str) else str(v)
     else:
-        # Fallback: try common field names.
-        for attr in ("answer", "reasoning", "rationale", "response"):
-            val = getattr(prediction, attr, None)
-            if val is not None:
-                outputs[attr] = str(val)
+        to_dict = getattr(prediction, "toDict", None)
+        if to_dict is not None:
+            outputs = {k: str(v) for k, v in to_dict().items()}
+        else:
+            # Fallback: try common field names.
+            for attr in ("answer", "reasoning", "rationale", "response"):
+                val = getattr(prediction, attr, None)
+                if val is not None:
+                    outputs[attr] = str(val)
 
     # Map DSPy's "rationale" to "reasoning" for the Go plugin's THINK block.
     if "rationale" in outputs and "reasoning" not in outputs:
         outputs["reasoning"] = outputs.pop("rationale")
 
-    return {"outputs": outputs}
+    return outputs
 
 
 # ─── Streaming invocation ────────────────────────────────────────────────────
 
-def _parse_output_fields(signature: str) -> list[str]:
+_SIG_OUTPUTS_RE = re.compile(r"->\s*(.*)$", re.DOTALL)
+_SIG_FIELD_RE = re.compile(r"([A-Za-z_][A-Za-z0-9_]*)\s*(?::[^,]+)?")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_output_fields(signature: str) -> tuple[str, ...]:
     """Extract output field names from a DSPy signature string.
 
-    ``"history, question -> answer"`` → ``["answer"]``
-    ``"question -> answer, summary"`` → ``["answer", "summary"]``
+    ``"history, question -> answer"`` → ``("answer",)``
+    ``"question -> answer, summary"`` → ``("answer", "summary")``
     """
-    parts = signature.split("->", 1)
-    if len(parts) < 2:
-        return ["answer"]
-    fields = []
-    for f in parts[1].split(","):
-        f = f.strip()
-        # Strip optional type annotations like "field: str"
-        if ":" in f:
-            f = f.split(":")[0].strip()
-        if f:
-            fields.append(f)
-    return fields or ["answer"]
+    m = _SIG_OUTPUTS_RE.search(signature)
+    if m is None:
+        return ("answer",)
+    # Optional type annotations like "field: str" are consumed by the regex.
+    return tuple(_SIG_FIELD_RE.findall(m.group(1))) or ("answer",)
 
 
 def _build_stream_listeners(
@@ -198,17 +332,19 @@ def _build_stream_listeners(
     CoT and ReAct automatically add a ``reasoning`` field; we always listen
     for it so it can be routed to ``reasoning_content`` on the Go side.
     """
-    from dspy.streaming import StreamListener
+    if StreamListener is None:
+        # streamify still yields raw ModelResponseStream deltas without
+        # listeners; _iter_stream handles those as a fallback.
+        return []
 
     output_fields = _parse_output_fields(signature)
 
     # Always include reasoning (CoT/ReAct add it, Predict doesn't but
     # having an extra listener for a missing field is harmless).
-    listen_fields = list(dict.fromkeys(["reasoning"] + output_fields))
-
-    listeners = []
-    for field in listen_fields:
-        listeners.append(StreamListener(signature_field_name=field))
+    listeners = [StreamListener(signature_field_name="reasoning")]
+    for field in output_fields:
+        if field != "reasoning":
+            listeners.append(StreamListener(signature_field_name=field))
     return listeners
 
 
@@ -217,8 +353,8 @@ async def invoke_stream(
     inputs: dict[str, Any],
     signature: str,
     kind: str,
-):
-    """Yield SSE events from a streamified DSPy module."""
+) -> AsyncGenerator[dict, None]:
+    """Yield SSE event payloads from a streamified DSPy module."""
     try:
         listeners = _build_stream_listeners(module, signature, kind)
         stream_module = dspy.streamify(
@@ -228,16 +364,94 @@ async def invoke_stream(
         )
         stream = stream_module(**inputs)
 
-        async for chunk in _iter_stream(stream):
-            yield chunk
+        async for event in _iter_stream(stream):
+            yield event
 
     except Exception as exc:
-        logger.error("Streaming error: %s", traceback.format_exc())
-        yield _sse_event({"type": "status", "message": f"error: {exc}"})
+        logger.error("Streaming error", exc_info=True)
+        yield {"type": "status", "message": f"error: {exc}"}
+
+
+def _handle_status(item: Any) -> tuple[dict, ...]:
+    return ({"type": "status", "message": str(item)},)
+
+
+def _handle_model_response_stream(item: Any) -> tuple[dict, ...]:
+    # Raw litellm streaming chunk — extract delta content.
+    choices = getattr(item, "choices", None)
+    if not choices:
+        return ()
+    delta = getattr(choices[0], "delta", None)
+    if not delta:
+        return ()
+    events = []
+    # Reasoning / thinking content
+    reasoning = getattr(delta, "reasoning_content", None)
+    if reasoning:
+        events.append({
+            "type": "chunk",
+            "field": "reasoning",
+            "text": reasoning if isinstance(reasoning, str) else str(reasoning),
+        })
+    # Regular text content
+    content = getattr(delta, "content", None)
+    if content:
+        events.append({
+            "type": "chunk",
+            "field": "answer",
+            "text": content if isinstance(content, str) else str(content),
+        })
+    return tuple(events)
+
+
+def _handle_stream_response(item: Any) -> tuple[dict, ...]:
+    # Higher-level DSPy StreamResponse (when stream_listeners are active).
+    # Has .signature_field_name and .chunk.
+    field = getattr(item, "signature_field_name", "answer")
+    # Normalise rationale → reasoning for the Go plugin's THINK block.
+    if field == "rationale":
+        field = "reasoning"
+    chunk = getattr(item, "chunk", "")
+    if not chunk:
+        return ()
+    return ({
+        "type": "chunk",
+        "field": field,
+        "text": chunk if isinstance(chunk, str) else str(chunk),
+    },)
+
+
+def _handle_prediction(item: Any) -> tuple[dict, ...]:
+    # Final prediction — emit all outputs.
+    return ({"type": "prediction", "outputs": _prediction_outputs(item)},)
+
+
+# Exact-type dispatch for items yielded by dspy.streamify.  Subclasses are
+# resolved through the MRO on first sight and cached here as well.
+_STREAM_HANDLERS = {
+    cls: handler
+    for cls, handler in (
+        (StreamResponse, _handle_stream_response),
+        (StatusMessage, _handle_status),
+        (Prediction, _handle_prediction),
+        (ModelResponseStream, _handle_model_response_stream),
+    )
+    if cls is not None
+}
 
 
-async def _iter_stream(stream):
-    """Iterate a DSPy stream, yielding SSE event strings.
+def _resolve_stream_handler(cls: type):
+    """Find (and cache) the handler for *cls*; unknown types become status."""
+    handler = next(
+        (_STREAM_HANDLERS[base] for base in cls.__mro__ if base in _STREAM_HANDLERS),
+        _handle_status,
+    )
+    _STREAM_HANDLERS[cls] = handler
+    return handler
+
+
+async def _iter_stream(stream: AsyncIterator[Any]) -> AsyncGenerator[dict, None]:
+    """Iterate a DSPy stream, yielding SSE event payloads (dicts).
 
     With ``stream_listeners`` configured, dspy.streamify yields:
     - ``StreamResponse`` (dspy) — parsed field-level chunks with
@@ -246,80 +460,126 @@ async def _iter_stream(stream):
     - ``Prediction`` — the final assembled prediction.
     - ``ModelResponseStream`` (litellm) — raw LM deltas, only when listeners
       cannot capture (e.g. cache hits).  Treated as fallback.
+
+    Anything else is emitted raw as a ``status`` event.
     """
     try:
         # dspy.streamify returns an async generator.
         async for item in stream:
-            type_name = type(item).__name__
-
-            if type_name == "StatusMessage":
-                yield _sse_event({"type": "status", "message": str(item)})
-
-            elif type_name == "ModelResponseStream":
-                # Raw litellm streaming chunk — extract delta content.
-                choices = getattr(item, "choices", None)
-                if choices and len(choices) > 0:
-                    delta = getattr(choices[0], "delta", None)
-                    if delta:
-                        # Reasoning / thinking content
-                        reasoning = getattr(delta, "reasoning_content", None)
-                        if reasoning:
-                            yield _sse_event({
-                                "type": "chunk",
-                                "field": "reasoning",
-                                "text": str(reasoning),
-                            })
-                        # Regular text content
-                        content = getattr(delta, "content", None)
-                        if content:
-                            yield _sse_event({
-                                "type": "chunk",
-                                "field": "answer",
-                                "text": str(content),
-                            })
-
-            elif type_name == "StreamResponse":
-                # Higher-level DSPy StreamResponse (when stream_listeners are active).
-                # Has .signature_field_name and .chunk.
-                field = getattr(item, "signature_field_name", "answer")
-                # Normalise rationale → reasoning for the Go plugin's THINK block.
-                if field == "rationale":
-                    field = "reasoning"
-                chunk = getattr(item, "chunk", "")
-                if chunk:
-                    yield _sse_event({
-                        "type": "chunk",
-                        "field": field,
-                        "text": str(chunk),
-                    })
-
-            elif type_name == "Prediction":
-                # Final prediction — emit all outputs.
-                outputs: dict[str, str] = {}
-                if hasattr(item, "items"):
-                    for k, v in item.items():
-                        outputs[k] = str(v) if v is not None else ""
-                elif hasattr(item, "toDict"):
-                    outputs = {k: str(v) for k, v in item.toDict().items()}
-
-                if "rationale" in outputs and "reasoning" not in outputs:
-                    outputs["reasoning"] = outputs.pop("rationale")
-
-                yield _sse_event({"type": "prediction", "outputs": outputs})
-            else:
-                # Unknown chunk type; emit raw.
-                yield _sse_event({"type": "status", "message": str(item)})
+            handler = _STREAM_HANDLERS.get(type(item)) or _resolve_stream_handler(type(item))
+            for event in handler(item):
+                yield event
 
     except Exception as exc:
-        logger.error("Stream iteration error: %s", traceback.format_exc())
-        yield _sse_event({"type": "status", "message": f"error: {exc}"})
+        logger.error("Stream iteration error", exc_info=True)
+        yield {"type": "status", "message": f"error: {exc}"}
+
+
+_STREAM_BATCH_MAX = 8
+_STREAM_BATCH_DELAY = 0.01  # seconds
+_SSE_PING_INTERVAL = 15.0  # seconds, same as fastapi.sse
 
-    # SSE terminator.
-    yield "data: [DONE]\n\n"
+# Constant SSE frames, encoded once.
+_DONE = b"data: [DONE]\n\n"
+_PING = b": ping\n\n"
 
 
-def _sse_event(data: dict) -> str:
-    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+async def _coalesce_chunks(
+    events: AsyncIterator[dict],
+    max_batch: int = _STREAM_BATCH_MAX,
+    max_delay: float = _STREAM_BATCH_DELAY,
+    keepalive: float | None = _SSE_PING_INTERVAL,
+) -> AsyncGenerator[dict | None, None]:
+    """Merge consecutive same-field ``chunk`` events into ``chunks`` events.
+
+    A producer task drains *events* into a queue so the whole DSPy stream is
+    iterated from a single task.  Chunks for one field are flushed after
+    *max_batch* texts or *max_delay* seconds, whichever comes first; a batch
+    of one is passed through as a plain ``chunk``.
+
+    When no event arrives for *keepalive* seconds, ``None`` is yielded so
+    the SSE encoder can send a ping and keep proxies from timing out.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    end = object()
+
+    async def _produce():
+        try:
+            async for event in events:
+                queue.put_nowait(event)
+        finally:
+            queue.put_nowait(end)
+
+    producer = asyncio.create_task(_produce())
+    getter: asyncio.Future | None = None
+    carry = None
+    try:
+        while True:
+            if carry is not None:
+                event, carry = carry, None
+            elif getter is None and not queue.empty():
+                event = queue.get_nowait()
+            else:
+                if getter is None:
+                    getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait((getter,), timeout=keepalive)
+                if not done:
+                    yield None
+                    continue
+                event, getter = getter.result(), None
+            if event is end:
+                break
+            if event["type"] != "chunk":
+                yield event
+                continue
+
+            field = event["field"]
+            texts = [event["text"]]
+            deadline = loop.time() + max_delay
+            while len(texts) < max_batch:
+                try:
+                    nxt = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    # asyncio.wait leaves the getter running on timeout, so
+                    # an item arriving late is picked up, never dropped.
+                    if getter is None:
+                        getter = asyncio.ensure_future(queue.get())
+                    timeout = max(deadline - loop.time(), 0.0)
+                    done, _ = await asyncio.wait((getter,), timeout=timeout)
+                    if not done:
+                        break
+                    nxt, getter = getter.result(), None
+                if nxt is end or nxt["type"] != "chunk" or nxt["field"] != field:
+                    carry = nxt
+                    break
+                texts.append(nxt["text"])
+
+            if len(texts) == 1:
+                yield event
+            else:
+                yield {"type": "chunks", "field": field, "texts": texts}
+    finally:
+        if getter is not None:
+            getter.cancel()
+        producer.cancel()
+
+
+async def _sse_stream(events: AsyncIterator[dict | None]) -> AsyncGenerator[bytes, None]:
+    """Frame event payloads from *events* as SSE and append ``[DONE]``.
+
+    Frames are yielded as ready-made bytes, which ``StreamingResponse``
+    writes to the socket without its per-chunk ``str`` → UTF-8 encode.
+    Payloads are compact single-line JSON, so each one maps to exactly one
+    ``data:`` line and needs no multi-line splitting.  A ``None`` payload
+    (an idle tick from ``_coalesce_chunks``) becomes a keep-alive comment.
+    """
+    async for event in events:
+        if event is None:
+            yield _PING
+        else:
+            yield b"data: " + _json_dumps(event) + b"\n\n"
+    yield _DONE
 
 
 # ─── FastAPI endpoints ───────────────────────────────────────────────────────
@@ -327,14 +587,15 @@ def _sse_event(data: dict) -> str:
 @app.post("/invoke")
 async def invoke(request: Request):
     """Main endpoint called by the Go DSPy plugin."""
+    raw = await request.body()
     try:
-        body = await request.json()
-    except Exception:
+        body = _json_loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
         return JSONResponse({"error": "invalid JSON body"}, status_code=400)
 
     kind: str = body.get("kind", "cot")
     signature: str = body.get("signature", "question -> answer")
-    raw_inputs: dict = body.get("inputs", {})
+    inputs: dict = body.get("inputs") or {}
     tools: list = body.get("tools", [])
     model: str = body.get("model", DEFAULT_LM)
     stream: bool = body.get("stream", False)
@@ -342,7 +603,8 @@ async def invoke(request: Request):
 
     logger.info("invoke kind=%s model=%s stream=%s sig=%s", kind, model, stream, signature)
 
-    # Configure DSPy LM per-request using dspy.context (async-safe).
+    # Configure DSPy LM per-request using dspy.context (async-safe).  The LM
+    # is cached and shared across requests, so keep per-call history off it.
     lm = build_lm(model, auth_token)
 
     # Build module.
@@ -351,19 +613,20 @@ async def invoke(request: Request):
     except ValueError as exc:
         return JSONResponse({"error": str(exc)}, status_code=400)
 
-    # Prepare inputs — deserialise history field if present.
-    inputs = dict(raw_inputs)
+    # Prepare inputs — deserialise history field if present.  ``inputs`` is
+    # owned by the freshly parsed body, so it is updated in place.
     if "history" in inputs:
         inputs["history"] = build_history_value(inputs["history"])
 
     if stream:
+        # dspy.context is a ContextVar override entered once per stream; the producer task inherits it.
         async def _stream_with_ctx():
-            with dspy.context(lm=lm):
-                async for chunk in invoke_stream(module, inputs, signature, kind):
-                    yield chunk
+            with dspy.context(lm=lm, disable_history=True):
+                async for event in _coalesce_chunks(invoke_stream(module, inputs, signature, kind)):
+                    yield event
 
         return StreamingResponse(
-            _stream_with_ctx(),
+            _sse_stream(_stream_with_ctx()),
             media_type="text/event-stream",
             headers={
                 "Cache-Control": "no-cache, no-transform",
@@ -373,14 +636,11 @@ async def invoke(request: Request):
         )
     else:
         try:
-            def _sync_with_ctx():
-                with dspy.context(lm=lm):
-                    return invoke_sync(module, inputs)
-
-            result = await asyncio.to_thread(_sync_with_ctx)
+            with dspy.context(lm=lm, disable_history=True):
+                result = await invoke_async(module, inputs)
             return JSONResponse(result)
         except Exception as exc:
-            logger.error("Invoke error: %s", traceback.format_exc())
+            logger.error("Invoke error", exc_info=True)
             return JSONResponse({"error": str(exc)}, status_code=500)
 
 
@@ -394,4 +654,12 @@ async def health():
 
 if __name__ == "__main__":
     logger.info("Starting DSPy sidecar on port %d, router at %s", SIDECAR_PORT, ROUTER_BASE_URL)
-    uvicorn.run(app, host="0.0.0.0", port=SIDECAR_PORT, log_level="info")
+    uvicorn.run(
+        # Multiple worker processes need an import string to re-import the app.
+        "main:app" if SIDECAR_PROCS > 1 else app,
+        host="0.0.0.0",
+        port=SIDECAR_PORT,
+        log_level="warning",
+        access_log=False,
+        workers=SIDECAR_PROCS,
+    )
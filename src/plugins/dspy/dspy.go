@@ -264,8 +264,8 @@ func (d *DSPy) handleStreaming(
 		}
 
 		switch sEvent.Type {
-		case "chunk":
-			chunkProg := buildStreamChunk(payload.Model, sEvent.Field, sEvent.Text, chunkIndex == 0)
+		case "chunk", "chunks":
+			chunkProg := buildStreamChunk(payload.Model, sEvent.Field, sEvent.chunkText(), chunkIndex == 0)
 			chunkData, err := chunkEmitter.EmitStreamChunk(chunkProg)
 			if err != nil {
 				plugin.Logger.Debug("dspy: emit stream chunk error", zap.Error(err))
@@ -415,10 +415,11 @@ type sidecarToolCall struct {
 }
 
 type sidecarStreamEvent struct {
-	Type    string `json:"type"`              // "chunk", "status", "tool_call", "prediction"
-	Field   string `json:"field,omitempty"`   // for "chunk": signature field name
-	Text    string `json:"text,omitempty"`    // for "chunk": token content
-	Message string `json:"message,omitempty"` // for "status"
+	Type    string   `json:"type"`              // "chunk", "chunks", "status", "tool_call", "prediction"
+	Field   string   `json:"field,omitempty"`   // for "chunk"/"chunks": signature field name
+	Text    string   `json:"text,omitempty"`    // for "chunk": token content
+	Texts   []string `json:"texts,omitempty"`   // for "chunks": coalesced token contents
+	Message string   `json:"message,omitempty"` // for "status"
 
 	// For "tool_call"
 	CallID   string          `json:"call_id,omitempty"`
@@ -429,6 +430,16 @@ type sidecarStreamEvent struct {
 	Outputs map[string]string `json:"outputs,omitempty"`
 }
 
+// chunkText returns the token content of a "chunk" event, or the joined
+// contents of a "chunks" event (several tokens the sidecar coalesced into
+// one SSE frame).
+func (e *sidecarStreamEvent) chunkText() string {
+	if e.Type == "chunks" {
+		return strings.Join(e.Texts, "")
+	}
+	return e.Text
+}
+
 // buildSidecarPayload extracts inputs from the AIL program for the sidecar.
 func buildSidecarPayload(kind, signature string, prog *ail.Program) (*sidecarRequest, error) {
 	inputFields, _ := parseSignatureFields(signature)
@@ -1,6 +1,7 @@
 package dspy
 
 import (
+	"encoding/json"
 	"testing"
 )
 
@@ -101,3 +102,20 @@ func TestStripDspySuffix(t *testing.T) {
 		}
 	}
 }
+
+func TestSidecarStreamEvent_ChunkText(t *testing.T) {
+	cases := []struct{ in, want string }{
+		{`{"type":"chunk","field":"answer","text":"Hel"}`, "Hel"},
+		{`{"type":"chunks","field":"answer","texts":["Hel","lo",", world"]}`, "Hello, world"},
+		{`{"type":"chunks","field":"reasoning","texts":[]}`, ""},
+	}
+	for _, tc := range cases {
+		var ev sidecarStreamEvent
+		if err := json.Unmarshal([]byte(tc.in), &ev); err != nil {
+			t.Fatalf("unmarshal %s: %v", tc.in, err)
+		}
+		if got := ev.chunkText(); got != tc.want {
+			t.Errorf("chunkText(%s) = %q, want %q", tc.in, got, tc.want)
+		}
+	}
+}